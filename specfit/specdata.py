@@ -3,15 +3,61 @@ from astroquery.jplspec import JPLSpec as JPL
 import astropy.units as u
 import astropy.constants as ac
 import numpy as np
-from scipy.interpolate import interp1d
-from astropy.io import ascii
+import warnings
+from scipy.interpolate import BSpline, PPoly, splrep
+from astropy.table import Table, Column, MaskedColumn
+import bisect
+import functools
 
 h = ac.h.cgs.value
 c = ac.c.cgs.value
 k_B = ac.k_B.cgs.value
+hc_kB = h * c / k_B  # K cm
+h_kB = h / k_B  # K s
+
+
+# species tables retrieved from the databases, memoized per session
+# (keyed by (database, use_cached))
+_species_tables = {}
+# partition functions read from the species tables, memoized per session
+# (keyed by ("JPL", tag) or ("CDMS", use_cached, tag))
+# NOTE: the memoized objects are shared, not copied: the same species table is set to
+# SpectroscopicData.species_table and the same PartitionFunction to
+# table.meta["Partition Function"] of every instance querying that species, so they
+# should be treated as read-only.
+_partition_functions = {}
+
+
+def _get_species_table(database, use_cached=False):
+    """get the species table of JPL or CDMS with a mapping from species tag to row index.
+    The table is retrieved (and the mapping built) only on the first call."""
+    key = (database, use_cached)
+    if key not in _species_tables:
+        if database == "JPL":
+            table = JPL.get_species_table()
+            tags = table["TAG"]
+        elif database == "CDMS":
+            table = CDMS.get_species_table(use_cached=use_cached)
+            tags = table["tag"]
+        else:
+            raise ValueError("``database'' should be either ``JPL'' or ``CDMS''.")
+        tags = np.asarray(tags, dtype=int).tolist()
+        _species_tables[key] = (table, dict(zip(tags, range(len(tags)))))
+    return _species_tables[key]
+
+
+def clear_cache(database=None):
+    """clear the species tables and partition functions memoized for ``database''
+    (``JPL'' or ``CDMS''; both if None), so that they are retrieved again on the next
+    query. Objects already set to existing instances are not affected."""
+    for memo in (_species_tables, _partition_functions):
+        for key in [key for key in memo if database in (None, key[0])]:
+            del memo[key]
 
 
 class PartitionFunction:
+    _ngrid = 1024  # number of log-spaced temperatures for fast array evaluation
+
     def __init__(self, species, T, Q, database=None, ntrans=None):
         self.species = species
         self.T = T
@@ -19,27 +65,150 @@ class PartitionFunction:
         self.database = database
         self.ntrans = ntrans
 
-        self.function = self._get_function()
-
-    def __call__(self, T, verbose=False):
+        # interpolating cubic spline, fitted once and shared by all evaluation paths
+        tck = splrep(*self._get_data(), k=3, s=0)
+        self.function = self._get_function(tck)
+        self._breaks, self._coeffs = self._get_piecewise_polynomial(tck)
+        (
+            self._T_grid_min,
+            self._T_grid_max,
+            self._logT_grid,
+            self._logQ_grid,
+        ) = self._get_grid()
+
+    def __call__(self, T, verbose=False, use_spline=False):
         if verbose and (T < np.nanmin(self.T) or T > np.nanmax(self.T)):
             print(
                 "Warning: Input temperature is smaller or larger than the original partition function data. Will be evaluated by extrapolation."
             )
-        val = self.function(T)
-        if val.size == 1:
-            return float(val)
+        if np.ndim(T) == 0:
+            return self._evaluate_scalar(float(T))
+        elif use_spline:
+            return self.function(T)
         else:
+            # linear interpolation of log Q vs. log T on the precomputed grid; values
+            # outside of the grid range are extrapolated with the spline
+            T = np.asarray(T, dtype=float)
+            with np.errstate(divide="ignore", invalid="ignore"):  # T <= 0 is outside
+                logT = np.log(T)
+            val = np.exp(np.interp(logT, self._logT_grid, self._logQ_grid))
+            outside = (T < self._T_grid_min) | (T > self._T_grid_max)
+            if outside.any():
+                val[outside] = self.function(T[outside])
             return val
 
-    def _get_function(self):
-        T = self.T[~np.isnan(self.Q)]
-        Q = self.Q[~np.isnan(self.Q)]
-        return interp1d(T, Q, kind="cubic", fill_value="extrapolate")
+    def _get_data(self):
+        mask = ~np.isnan(self.Q)
+        T = self.T[mask]
+        Q = self.Q[mask]
+        # spline requires increasing temperature order
+        order = np.argsort(T)
+        return T[order], Q[order]
+
+    def _get_function(self, tck):
+        # extrapolates with the end pieces like InterpolatedUnivariateSpline(ext=0)
+        return BSpline(*tck, extrapolate=True)
+
+    def _get_piecewise_polynomial(self, tck):
+        # cubic coefficients of the spline on each knot interval, kept as plain Python
+        # lists for the scalar evaluation below
+        pp = PPoly.from_spline(tck)
+        nonzero = np.diff(pp.x) > 0  # drop zero-length intervals at repeated end knots
+        breaks = pp.x[:-1][nonzero].tolist()
+        coeffs = [tuple(c) for c in pp.c[:, nonzero].T.tolist()]
+        return breaks, coeffs
+
+    def _get_grid(self):
+        knots = self.function.t
+        T_min, T_max = knots[0], knots[-1]
+        T = np.geomspace(T_min, T_max, self._ngrid)
+        return T_min, T_max, np.log(T), np.log(self.function(T))
+
+    def _evaluate_scalar(self, T):
+        # binary search for the knot interval and Horner evaluation, which is much faster
+        # than calling into the spline for a single value; extrapolates with the end pieces
+        i = max(bisect.bisect_right(self._breaks, T) - 1, 0)
+        c3, c2, c1, c0 = self._coeffs[i]
+        dT = T - self._breaks[i]
+        return ((c3 * dT + c2) * dT + c1) * dT + c0
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_CDMS_partition_function_header(colnames):
+    """get the partition function columns, named like lg(Q(300)), and their temperatures
+    from the CDMS species table header. Parsed only once per set of column names."""
+    lg_cols = tuple(k for k in colnames if "lg" in k)
+    T = tuple(float(k.split("(")[-1].split(")")[0]) for k in lg_cols)
+    return lg_cols, T
+
+
+def _row_to_array(row):
+    """convert the first row of a table into a float array. Masked or zero entries are
+    regarded as missing values and set to NaN."""
+    arr = np.array(row.as_array().tolist()[0], dtype=float)  # masked -> None -> NaN
+    return np.where(np.isfinite(arr) & (arr != 0.0), arr, np.nan)
+
+
+def _convert_fixed_width_field(field):
+    """convert a column of stripped byte strings to int, float, or str (tried in this
+    order) like the astropy ascii reader. Blank entries are masked."""
+    blank = field == b""
+    values = np.where(blank, b"0", field) if blank.any() else field
+    data = None
+    for dtype in (np.int64, np.float64):
+        try:
+            data = values.astype(dtype)
+            break
+        except ValueError:
+            continue
+        except OverflowError:  # integers beyond int64 revert to str as in astropy
+            warnings.warn("OverflowError converting to int64, reverting to str.")
+            break
+    if data is None:
+        data = np.char.decode(field, "utf-8")
+    if blank.any():
+        return MaskedColumn(data, mask=blank)
+    return Column(data)
+
+
+def _read_fixed_width(filename, names, col_starts):
+    """read a headerless fixed-width catalog file (e.g. JPL or CDMS .cat files).
+    Each line is sliced at the byte offsets with numpy instead of being tokenized row by row.
+
+    Parameters
+    ----------
+    filename : str
+        path to the catalog file
+    names : list of str
+        column names
+    col_starts : list of int
+        starting position of each column; each column extends to the start of the next
+        one, and the last column to the end of the line
+
+    Returns
+    -------
+    astropy.table.Table
+        parsed table
+    """
+    with open(filename, "rb") as f:
+        lines = [line for line in f.read().splitlines() if line.strip()]
+    if not lines:
+        raise ValueError(f"No data lines found in {filename}.")
+    # pad so that columns starting beyond the end of every line are read as blank
+    nchar = max(max(len(line) for line in lines), max(col_starts) + 1)
+    chars = np.array(lines, dtype=f"S{nchar}").view("S1").reshape(len(lines), nchar)
+
+    columns = []
+    col_ends = list(col_starts[1:]) + [nchar]
+    for start, end in zip(col_starts, col_ends):
+        field = np.ascontiguousarray(chars[:, start:end]).view(f"S{end - start}")
+        columns.append(_convert_fixed_width_field(np.char.strip(field.ravel())))
+
+    return Table(columns, names=names)
 
 
 def wavenumber_to_Kelvin(wavenumber):
-    return wavenumber * h * c / k_B
+    return wavenumber * hc_kB
 
 
 def logint_to_EinsteinA(logint_300, nu0, gup, Elow, Q_300):
@@ -64,17 +233,40 @@ def logint_to_EinsteinA(logint_300, nu0, gup, Elow, Q_300):
     float or ndarray
         Einstein A coeff.
     """
-    Elow = wavenumber_to_Kelvin(Elow)
-    Eup = Elow + h * nu0 * 1e6 / k_B  # in K
-    Smu2 = (
-        2.40251e4
-        * 10**logint_300
-        * Q_300
-        / nu0
-        / (np.exp(-Elow / 300) - np.exp(-Eup / 300))
+    # A = 1.16395e-20 * nu0**3 * Smu2 / gup with
+    # Smu2 = 2.40251e4 * 10**logint_300 * Q_300 / nu0 / (exp(-Elow/300) - exp(-Eup/300));
+    # scalar factors are folded together and nu0**3 / nu0 is reduced to nu0 * nu0.
+    # Since Eup - Elow = h nu0 / k_B, the denominator is rewritten with expm1 to avoid
+    # cancellation for low-frequency lines.
+    # The expression is evaluated in place on two buffers to avoid temporaries.
+    shape = np.broadcast_shapes(
+        np.shape(logint_300), np.shape(nu0), np.shape(gup), np.shape(Elow)
     )
-    A = 1.16395e-20 * nu0**3 * Smu2 / gup
-    return A
+    A = np.empty(shape)
+    buf = np.empty(shape)
+
+    np.multiply(Elow, -hc_kB / 300, out=A)
+    np.exp(A, out=A)  # exp(-Elow/300) with Elow in K
+    np.multiply(nu0, -1e6 * h_kB / 300, out=buf)
+    np.expm1(buf, out=buf)
+    np.multiply(A, buf, out=A)  # -(exp(-Elow/300) - exp(-Eup/300))
+    np.multiply(nu0, nu0, out=buf)
+    np.divide(buf, A, out=A)
+    np.multiply(logint_300, np.log(10.0), out=buf)
+    np.exp(buf, out=buf)  # 10**logint_300
+    np.multiply(A, buf, out=A)
+    np.divide(A, gup, out=A)
+    np.multiply(A, -1.16395e-20 * 2.40251e4 * Q_300, out=A)
+
+    return A[()]  # scalar for scalar inputs
+
+
+def _stage_column(column):
+    """get column values as a float array; masked entries are set to NaN so that they do
+    not enter calculations as their fill values."""
+    if isinstance(column, MaskedColumn):
+        return np.asarray(column.astype(np.float64).filled(np.nan))
+    return np.asarray(column, dtype=np.float64)
 
 
 class SpectroscopicData:
@@ -96,32 +288,42 @@ class SpectroscopicData:
         self.gup = self.table["g_up"].value
         self.Eup = self.table["E_up"].value
 
+    def _to_column(self, data, sources, **kwargs):
+        # MaskedColumn if any of the source columns in the table is masked
+        masks = [
+            np.ma.getmaskarray(self.table[name])
+            for name in sources
+            if isinstance(self.table[name], MaskedColumn)
+        ]
+        if masks:
+            return MaskedColumn(data, mask=np.logical_or.reduce(masks), **kwargs)
+        return Column(data, **kwargs)
     
     # def add_partition_function(self, species_id):
 
     @staticmethod
     def read_JPL_partition_function(species_table, tag):
-        row = species_table[species_table["TAG"] == tag]
+        qlog_cols = [k for k in species_table.colnames if "QLOG" in k]
+        idx = int(np.flatnonzero(np.asarray(species_table["TAG"]) == tag)[0])
+        row = species_table[idx : idx + 1][qlog_cols]
 
         T = np.array(
             species_table.meta["Temperature (K)"][::-1]
         )  # reverse the order to be in increasing temperature order
-        Q = 10 ** np.array(
-            [float(row[k]) or np.nan for k in row.keys() if "QLOG" in k][::-1]
-        )
+        logQ = _row_to_array(row)[::-1]
+        Q = np.power(10.0, logQ)
 
         return T, Q
 
     @staticmethod
     def read_CDMS_partition_function(species_table, tag):
-        row = species_table[species_table["tag"] == tag]
+        lg_cols, T = _parse_CDMS_partition_function_header(tuple(species_table.colnames))
+        idx = int(np.flatnonzero(np.asarray(species_table["tag"]) == tag)[0])
+        row = species_table[idx : idx + 1][list(lg_cols)]
 
-        T = np.array(
-            [float(k.split("(")[-1].split(")")[0]) for k in row.keys() if "lg" in k]
-        )
-        Q = 10 ** np.array(
-            [float(row[k][0]) or np.nan for k in row.keys() if "lg" in k]
-        )
+        T = np.array(T)
+        logQ = _row_to_array(row)
+        Q = np.power(10.0, logQ)
 
         return T, Q
 
@@ -131,31 +333,33 @@ class SpectroscopicData:
         self.table = response
 
         # clean up resulting response
-        # 1. remove masked column
-        if self.table.mask is not None:
-            masked_columns = [
-                col for col in self.table.colnames if np.all(self.table.mask[col])
-            ]
-            self.table.remove_columns(masked_columns)
+        # 1. find masked column (removed in step 2 together with unnecessary columns)
+        mask = self.table.mask  # a new Table is built on every access, so fetch once
+        masked_columns = []
+        if mask is not None:
+            masked_columns = [col for col in mask.colnames if mask[col].all()]
         # 2. metadata (including partition function) if species is specified
         ## get the specie name which are added to metadata table
         if species is None:
             tag = abs(int(np.unique(self.table["TAG"])[0]))
-            species_table = JPL.get_species_table()
+            species_table, tag_index = _get_species_table("JPL")
             try:
-                idx = species_table["TAG"].tolist().index(tag)
-            except ValueError:
+                idx = tag_index[tag]
+            except KeyError:
                 raise ValueError(f"No entries found for species tag {tag}. Please specify ``species'' argument.")
         
             self.species = species_table["NAME"][idx]
 
             if pf is None:
-                T, Q = self.read_JPL_partition_function(
-                    species_table=species_table, tag=tag
-                )
-                self.table.meta["Partition Function"] = PartitionFunction(
-                    species=self.species, T=T, Q=Q, ntrans=species_table["NLINE"]
-                )
+                key = ("JPL", tag)
+                if key not in _partition_functions:
+                    T, Q = self.read_JPL_partition_function(
+                        species_table=species_table, tag=tag
+                    )
+                    _partition_functions[key] = PartitionFunction(
+                        species=self.species, T=T, Q=Q, ntrans=species_table["NLINE"]
+                    )
+                self.table.meta["Partition Function"] = _partition_functions[key]
             else:
                 self.table.meta["Partition Function"] = pf
         
@@ -167,48 +371,65 @@ class SpectroscopicData:
 
         self.table.meta["Species"] = self.species
 
-        # 2. remove unnecessary columns
-        self.table.remove_columns(["DR", "TAG", "QNFMT"])
+        # 2. remove masked and unnecessary columns at once
+        drop = set(masked_columns) | set(["DR", "TAG", "QNFMT"])
         if nofreqerr:
-            self.table.remove_column("ERR")
+            drop.add("ERR")
+        self.table.remove_columns([col for col in self.table.colnames if col in drop])
         self.table.add_column(
-            col=[self.species] * len(self.table), name="Species", index=0
+            col=np.full(len(self.table), self.species), name="Species", index=0
         )
 
         # 3. some calculus to make table values useful
-        # 3-1. rename frequency (and error) and to GHz
-        self.table.rename_column("FREQ", "Frequency")
-        self.table["Frequency"] *= 1e-3
-        self.table["Frequency"].unit = u.GHz
-        self.table["Frequency"].format = "{:.7f}"
-        if not nofreqerr:
-            self.table.rename_column("ERR", "Frequency Error")
-            self.table["Frequency Error"] *= 1e-3
-            self.table["Frequency Error"].unit = u.GHz
-            self.table["Frequency Error"].format = "{:.7f}"
-
-        # 3-2. A coeff to not log
-        self.table.rename_column("LGINT", "A_ul")
-        self.table["A_ul"] = logint_to_EinsteinA(
-            logint_300=self.table["A_ul"],
-            nu0=self.table["Frequency"] * 1e3,  # in MHz
-            gup=self.table["GUP"],
-            Elow=self.table["ELO"],
+        # stage the required columns as plain arrays and write them back once
+        freq_MHz = _stage_column(self.table["FREQ"])
+        freq = freq_MHz * 1e-3  # in GHz
+        elo = _stage_column(self.table["ELO"])  # in cm-1
+        gup = _stage_column(self.table["GUP"])
+        lgint = _stage_column(self.table["LGINT"])
+
+        # 3-1. A coeff to not log
+        A_ul = logint_to_EinsteinA(
+            logint_300=lgint,
+            nu0=freq_MHz,
+            gup=gup,
+            Elow=elo,
             Q_300=self.table.meta["Partition Function"](300),
         )
-        self.table["A_ul"].format = "{:.4e}"
-
-        # 3-3. E_low to E_up
-        self.table.rename_column("ELO", "E_up")
-        self.table["E_up"] = (
-            wavenumber_to_Kelvin(self.table["E_up"])
-            + h * self.table["Frequency"] * 1e9 / k_B
-        )
-        self.table["E_up"].unit = "K"
-        self.table["E_up"].format = "{:.5f}"
 
-        # 3-4. GUP to g_up
-        self.table.rename_column("GUP", "g_up")
+        # 3-2. E_low to E_up
+        E_up = wavenumber_to_Kelvin(elo) + freq * (1e9 * h_kB)
+
+        # 3-3. write back frequency (and error) in GHz, A coeff, and E_up with units
+        # (masked columns stay masked, with the masks of the columns they derive from)
+        columns = {
+            "FREQ": self._to_column(freq, ["FREQ"], unit=u.GHz, format="{:.7f}"),
+            "LGINT": self._to_column(
+                A_ul, ["LGINT", "FREQ", "GUP", "ELO"], format="{:.4e}"
+            ),
+            "ELO": self._to_column(E_up, ["ELO", "FREQ"], unit="K", format="{:.5f}"),
+        }
+        if not nofreqerr:
+            columns["ERR"] = self._to_column(
+                _stage_column(self.table["ERR"]) * 1e-3,
+                ["ERR"],
+                unit=u.GHz,
+                format="{:.7f}",
+            )
+        for name, col in columns.items():
+            self.table[name] = col
+
+        # 3-4. rename columns
+        names = {
+            "FREQ": "Frequency",
+            "ERR": "Frequency Error",
+            "LGINT": "A_ul",
+            "ELO": "E_up",
+            "GUP": "g_up",
+        }
+        if nofreqerr:
+            del names["ERR"]
+        self.table.rename_columns(list(names.keys()), list(names.values()))
 
         # setup
         self._set_quantities()
@@ -218,66 +439,87 @@ class SpectroscopicData:
         self.table = response
 
         # clean up resulting response
-        # 1. remove masked column
-        if self.table.mask is not None:
-            masked_columns = [
-                col for col in self.table.colnames if np.all(self.table.mask[col])
-            ]
-            self.table.remove_columns(masked_columns)
+        # 1. find masked column (removed in step 2 together with unnecessary columns)
+        mask = self.table.mask  # a new Table is built on every access, so fetch once
+        masked_columns = []
+        if mask is not None:
+            masked_columns = [col for col in mask.colnames if mask[col].all()]
         # 2. metadata (including partition function) if species is specified
         ## get the specie name and molweight which are added to metadata table
         self.molweight = int(np.unique(self.table["MOLWT"])[0])
         tag = int(self.molweight * 1e3 + abs(int(np.unique(self.table["TAG"])[0])))
-        self.species_table = CDMS.get_species_table(use_cached=use_cached)
-        idx = self.species_table["tag"].tolist().index(tag)
+        self.species_table, tag_index = _get_species_table("CDMS", use_cached=use_cached)
+        try:
+            idx = tag_index[tag]
+        except KeyError:
+            raise ValueError(f"No entries found for species tag {tag}.")
         self.species = self.species_table["molecule"][idx]
 
         self.table.meta["Species"] = self.species
         self.table.meta["Molecular Weight"] = self.molweight
 
         # partition function
-        T, Q = self.read_CDMS_partition_function(
-            species_table=self.species_table, tag=tag
-        )
-        self.table.meta["Partition Function"] = PartitionFunction(
-            species=self.species, T=T, Q=Q, ntrans=self.species_table["#lines"]
-        )
+        key = ("CDMS", use_cached, tag)
+        if key not in _partition_functions:
+            T, Q = self.read_CDMS_partition_function(
+                species_table=self.species_table, tag=tag
+            )
+            _partition_functions[key] = PartitionFunction(
+                species=self.species, T=T, Q=Q, ntrans=self.species_table["#lines"]
+            )
+        self.table.meta["Partition Function"] = _partition_functions[key]
 
-        # 2. remove unnecessary columns
-        self.table.remove_columns(["DR", "TAG", "QNFMT", "MOLWT", "Lab"])
+        # 2. remove masked and unnecessary columns at once
+        drop = set(masked_columns) | set(["DR", "TAG", "QNFMT", "MOLWT", "Lab"])
         if nofreqerr:
-            self.table.remove_column("ERR")
-        self.table.add_column(col=self.table["name"], name="Species", index=0)
+            drop.add("ERR")
+        self.table.remove_columns([col for col in self.table.colnames if col in drop])
+        # move the existing name column to the front without duplicating it
+        self.table.add_column(
+            col=self.table["name"], name="Species", index=0, copy=False
+        )
         self.table.remove_column("name")
 
         # 3. some calculus to make table values useful
-        # 3-1. rename frequency (and error) and to GHz
-        self.table.rename_column("FREQ", "Frequency")
-        self.table["Frequency"] *= 1e-3
-        self.table["Frequency"].unit = u.GHz
-        self.table["Frequency"].format = "{:.7f}"
+        # stage the required columns as plain arrays and write them back once
+        freq = _stage_column(self.table["FREQ"]) * 1e-3  # in GHz
+        elo = _stage_column(self.table["ELO"])  # in cm-1
+        lgaij = _stage_column(self.table["LGAIJ"])
+
+        # 3-1. A coeff to not log
+        A_ul = 10**lgaij
+
+        # 3-2. E_low to E_up
+        E_up = wavenumber_to_Kelvin(elo) + freq * (1e9 * h_kB)
+
+        # 3-3. write back frequency (and error) in GHz, A coeff, and E_up with units
+        # (masked columns stay masked, with the masks of the columns they derive from)
+        columns = {
+            "FREQ": self._to_column(freq, ["FREQ"], unit=u.GHz, format="{:.7f}"),
+            "LGAIJ": self._to_column(A_ul, ["LGAIJ"], format="{:.4e}"),
+            "ELO": self._to_column(E_up, ["ELO", "FREQ"], unit="K", format="{:.5f}"),
+        }
         if not nofreqerr:
-            self.table.rename_column("ERR", "Frequency Error")
-            self.table["Frequency Error"] *= 1e-3
-            self.table["Frequency Error"].unit = u.GHz
-            self.table["Frequency Error"].format = "{:.7f}"
-
-        # 3-2. A coeff to not log
-        self.table.rename_column("LGAIJ", "A_ul")
-        self.table["A_ul"] = 10 ** self.table["A_ul"]
-        self.table["A_ul"].format = "{:.4e}"
-
-        # 3-3. E_low to E_up
-        self.table.rename_column("ELO", "E_up")
-        self.table["E_up"] = (
-            wavenumber_to_Kelvin(self.table["E_up"])
-            + h * self.table["Frequency"] * 1e9 / k_B
-        )
-        self.table["E_up"].unit = "K"
-        self.table["E_up"].format = "{:.5f}"
-
-        # 3-4. GUP to g_up
-        self.table.rename_column("GUP", "g_up")
+            columns["ERR"] = self._to_column(
+                _stage_column(self.table["ERR"]) * 1e-3,
+                ["ERR"],
+                unit=u.GHz,
+                format="{:.7f}",
+            )
+        for name, col in columns.items():
+            self.table[name] = col
+
+        # 3-4. rename columns
+        names = {
+            "FREQ": "Frequency",
+            "ERR": "Frequency Error",
+            "LGAIJ": "A_ul",
+            "ELO": "E_up",
+            "GUP": "g_up",
+        }
+        if nofreqerr:
+            del names["ERR"]
+        self.table.rename_columns(list(names.keys()), list(names.values()))
 
         # setup
         self._set_quantities()
@@ -307,6 +549,7 @@ class SpectroscopicData:
 
         # clear preivous caches
         CDMS.clear_cache()
+        clear_cache("CDMS")
 
         response = CDMS.query_lines(
             min_frequency=numin * u.Hz,
@@ -328,10 +571,8 @@ class SpectroscopicData:
     def parse_datafile(self, format="JPL", species=None, pf=None):
 
         if format == "JPL":
-            response = ascii.read(
+            response = _read_fixed_width(
                 self.filename,
-                header_start=None,
-                data_start=0,
                 names=(
                     "FREQ",
                     "ERR",
@@ -345,8 +586,6 @@ class SpectroscopicData:
                     'QN"',
                 ),
                 col_starts=(0, 13, 21, 29, 31, 41, 44, 51, 55, 67),
-                format="fixed_width",
-                fast_reader=False,
             )
 
             self.format_JPL(response=response, species=species, pf=pf)
@@ -377,14 +616,10 @@ class SpectroscopicData:
                 "name": 89,
             }
 
-            response = ascii.read(
+            response = _read_fixed_width(
                 self.filename,
-                header_start=None,
-                data_start=0,
                 names=list(starts.keys()),
                 col_starts=list(starts.values()),
-                format="fixed_width",
-                fast_reader=False,
             )
 
             self.format_CDMS(response=response)
@@ -0,0 +1,163 @@
+import numpy as np
+import pytest
+from astropy.io import ascii
+from astropy.table import MaskedColumn
+
+from specfit import specdata
+from specfit.specdata import (
+    PartitionFunction,
+    SpectroscopicData,
+    _read_fixed_width,
+    h,
+    k_B,
+    logint_to_EinsteinA,
+    wavenumber_to_Kelvin,
+)
+
+JPL_NAMES = ("FREQ", "ERR", "LGINT", "DR", "ELO", "GUP", "TAG", "QNFMT", "QN'", 'QN"')
+JPL_STARTS = (0, 13, 21, 29, 31, 41, 44, 51, 55, 67)
+JPL_LINES = [
+    "    1000.0000  0.0100 -6.9109 3   80.9360  1 -285031404 4 4 3 5     3 3 2 4    ",
+    "    1013.3700         -5.1229 3    4.9583  3 -285031404 4 4 3 5     3 3 2 4    ",
+    "    1026.7400  0.0300 -7.4398 3  273.8267  5 -285031404 4 4 3 5     3 3 2 4    ",
+]
+
+
+@pytest.fixture
+def pf():
+    return PartitionFunction(
+        species="X",
+        T=np.array([9.375, 18.75, 37.5, 75.0, 150.0, 225.0, 300.0]),
+        Q=np.array([3.0, 5.0, 9.0, 17.0, 33.0, 49.0, 65.0]),
+    )
+
+
+def logint_to_EinsteinA_closed_form(logint_300, nu0, gup, Elow, Q_300):
+    Elow = wavenumber_to_Kelvin(Elow)
+    Eup = Elow + h * nu0 * 1e6 / k_B
+    Smu2 = (
+        2.40251e4
+        * 10**logint_300
+        * Q_300
+        / nu0
+        / (np.exp(-Elow / 300) - np.exp(-Eup / 300))
+    )
+    return 1.16395e-20 * nu0**3 * Smu2 / gup
+
+
+def assert_tables_equal(expected, actual):
+    assert expected.colnames == actual.colnames
+    for name in expected.colnames:
+        assert expected[name].dtype == actual[name].dtype
+        mask_expected = np.ma.getmaskarray(expected[name])
+        mask_actual = np.ma.getmaskarray(actual[name])
+        np.testing.assert_array_equal(mask_expected, mask_actual)
+        np.testing.assert_array_equal(
+            np.asarray(expected[name])[~mask_expected],
+            np.asarray(actual[name])[~mask_actual],
+        )
+
+
+@pytest.mark.parametrize("nchar", [None, 55, 30])
+def test_read_fixed_width_matches_astropy(tmp_path, nchar):
+    filename = tmp_path / "catalog.cat"
+    filename.write_text("\n".join(line[:nchar] for line in JPL_LINES) + "\n")
+
+    expected = ascii.read(
+        filename,
+        names=JPL_NAMES,
+        col_starts=JPL_STARTS,
+        format="fixed_width_no_header",
+    )
+    actual = _read_fixed_width(filename, names=JPL_NAMES, col_starts=JPL_STARTS)
+
+    assert_tables_equal(expected, actual)
+
+
+def test_read_fixed_width_integer_overflow(tmp_path):
+    filename = tmp_path / "catalog.cat"
+    filename.write_text("123456789012345678901234 1\n                       2 2\n")
+
+    with pytest.warns(UserWarning, match="OverflowError"):
+        table = _read_fixed_width(filename, names=("a", "b"), col_starts=(0, 25))
+
+    assert table["a"].dtype.kind == "U"
+    assert table["b"].dtype == np.int64
+
+
+def test_read_fixed_width_empty_file(tmp_path):
+    filename = tmp_path / "catalog.cat"
+    filename.write_text("\n   \n")
+
+    with pytest.raises(ValueError, match="No data lines"):
+        _read_fixed_width(filename, names=JPL_NAMES, col_starts=JPL_STARTS)
+
+
+def test_format_JPL_keeps_masked_entries(tmp_path, pf):
+    filename = tmp_path / "catalog.cat"
+    lines = list(JPL_LINES)
+    lines[2] = lines[2][:21] + " " * 8 + lines[2][29:]  # blank LGINT
+    filename.write_text("\n".join(lines) + "\n")
+
+    data = SpectroscopicData(filename, format="JPL", species="X", pf=pf)
+
+    assert isinstance(data.table["Frequency Error"], MaskedColumn)
+    np.testing.assert_array_equal(
+        data.table["Frequency Error"].mask, [False, True, False]
+    )
+    np.testing.assert_array_equal(data.table["A_ul"].mask, [False, False, True])
+    assert not isinstance(data.table["Frequency"], MaskedColumn)
+
+
+def test_partition_function_scalar_matches_spline():
+    pf = PartitionFunction(
+        species="X",
+        T=np.array([1000.0, 300.0, 150.0, 75.0, 37.5, 18.75, 9.375]),
+        Q=np.array([1200.0, 300.0, 150.0, 80.0, np.nan, 20.0, 10.0]),
+    )
+    T = np.array([2.0, 9.375, 42.0, 300.0, 999.0, 1500.0])
+    np.testing.assert_allclose([pf(t) for t in T], pf(T, use_spline=True), rtol=1e-12)
+
+
+def test_partition_function_array_outside_grid(recwarn, pf):
+    T = np.array([0.0, 5.0, 100.0, 500.0])
+    np.testing.assert_allclose(pf(T), pf(T, use_spline=True), rtol=1e-4)
+    assert len(recwarn) == 0
+
+
+@pytest.mark.parametrize(
+    "args, rtol",
+    [
+        ((-6.9109, 1000.0, 1.0, 80.936, 65.0), 1e-12),
+        (
+            (
+                np.array([-6.9109, -5.1229, -7.4398]),
+                np.array([1000.0, 1013.37, 1026.74]),
+                np.array([1.0, 3.0, 5.0]),
+                np.array([80.936, 4.9583, 273.8267]),
+                65.0,
+            ),
+            1e-12,
+        ),
+        # low-frequency line: the closed form loses digits to cancellation
+        ((-9.0, 1.0, 3.0, 0.0, 65.0), 1e-6),
+    ],
+)
+def test_logint_to_EinsteinA_matches_closed_form(args, rtol):
+    A = logint_to_EinsteinA(*args)
+    np.testing.assert_allclose(A, logint_to_EinsteinA_closed_form(*args), rtol=rtol)
+    assert np.shape(A) == np.shape(args[0])
+
+
+def test_clear_cache(monkeypatch):
+    species_tables = {("JPL", False): "jpl", ("CDMS", False): "cdms"}
+    partition_functions = {("JPL", 1): "jpl", ("CDMS", False, 1): "cdms"}
+    monkeypatch.setattr(specdata, "_species_tables", species_tables)
+    monkeypatch.setattr(specdata, "_partition_functions", partition_functions)
+
+    specdata.clear_cache("CDMS")
+    assert list(species_tables) == [("JPL", False)]
+    assert list(partition_functions) == [("JPL", 1)]
+
+    specdata.clear_cache()
+    assert not species_tables and not partition_functions